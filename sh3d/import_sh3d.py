@@ -19,7 +19,11 @@
 #*                                                                         *
 #***************************************************************************
 
-from functools import partial
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import methodcaller
 from PySide.QtCore import QT_TRANSLATE_NOOP
 from zipfile import ZipFile
 
@@ -30,19 +34,44 @@ import DraftVecUtils
 import FreeCAD
 import FreeCADGui
 import Mesh
-import WorkingPlane
 
 import itertools
 import numpy
 import math
 import os
+import shutil
+import tempfile
+import time
 import uuid
-import xml.etree.ElementTree as ET
+
+# lxml is much faster than the standard library. It is used when available
+LXML_AVAILABLE = True
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+def _compile_path(path):
+    # With lxml the path is compiled once into an XPath evaluator. Otherwise
+    # it is looked up by findall, which keeps its own cache of parsed paths.
+    if LXML_AVAILABLE:
+        return ET.XPath(path)
+    return methodcaller('findall', path)
+
+# The paths of the child elements looked up for each imported element
+POINT_PATH = _compile_path('point')
+BASEBOARD_PATH = _compile_path('baseboard')
+MATERIAL_PATH = _compile_path('material')
+LIGHT_SOURCE_PATH = _compile_path('lightSource')
 
 # SweetHome3D is in cm while FreeCAD is in mm
 FACTOR = 10
 DEBUG = False
 DEBUG_COLOR = (255, 0, 0)
+# Property assignments copy the vectors, so these ones can be shared
+X_AXIS = FreeCAD.Vector(1, 0, 0)
+Z_AXIS = FreeCAD.Vector(0, 0, 1)
 
 RENDER_AVAILABLE = True
 
@@ -52,10 +81,36 @@ except:
     FreeCAD.Console.PrintWarning("Render is not available. Not creating any lights.\n")
     RENDER_AVAILABLE = False
 
-# This hash contains the document elemnt with their SH3D id as key
-shoul_merge_elements = True
+# This hash contains the document elements with their SH3D (shType, id) as key
+should_merge_elements = True
 document_elements = {}
 
+# The materials created during the current import, keyed by their
+# (name, color, shininess), so that identical materials are created once
+imported_materials = {}
+
+# The default colors are read from the preferences once per import
+default_floor_color = 'FF96A9BA'
+default_wall_color = 'FF96A9BA'
+
+# Whether the GUI is up, read once per import
+gui_up = False
+
+# Refreshes the GUI while importing, bound once per import to a no-op when
+# the GUI is not up, see _throttle
+def update_gui():
+    pass
+
+# The minimum time between two GUI refreshes while importing, in seconds
+GUI_UPDATE_INTERVAL = 0.05
+
+# The properties of each type of FC object, as (property_type, name,
+# description) tuples, see _add_properties
+BUILDING_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The element's id"),
+)
+
 def import_sh3d(filename, join_walls=True, merge_elements=True, import_doors=True, import_furnitures=True, import_lights=True, import_cameras=True, create_render_project=True, progress_callback=None):
     """Import a SweetHome 3D file into the current document.
 
@@ -79,20 +134,34 @@ def import_sh3d(filename, join_walls=True, merge_elements=True, import_doors=Tru
         def progress_callback(progress, status):
             FreeCAD.Console.PrintLog(f"{status} ({progress}/100)\n")
 
-    global shoul_merge_elements
+    global should_merge_elements
     global document_elements
-    shoul_merge_elements = merge_elements
-    if merge_elements:
+    global imported_materials
+    global default_floor_color
+    global default_wall_color
+    global gui_up
+    global update_gui
+    should_merge_elements = merge_elements
+    gui_up = bool(FreeCAD.GuiUp)
+    update_gui = _throttle(FreeCADGui.updateGui, GUI_UPDATE_INTERVAL) if gui_up else (lambda: None)
+    document_elements = {}
+    imported_materials = {}
+
+    pref = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/SH3D")
+    default_floor_color = pref.GetString("defaultFloorColor", 'FF96A9BA')
+    default_wall_color = pref.GetString("DefaultWallColor", 'FF96A9BA')
 
+    if merge_elements:
         for object in FreeCAD.ActiveDocument.Objects:
-            if hasattr(object, 'id'):
-                document_elements[object.id] = object
+            if hasattr(object, 'id') and hasattr(object, 'shType'):
+                document_elements[(object.shType, object.id)] = object
 
-    with ZipFile(filename, 'r') as zip:
+    with ZipFile(filename, 'r') as zip, _frozen_gui():
         entries = zip.namelist()
         if "Home.xml" not in entries:
             raise ValueError("Invalid SweetHome3D file: missing Home.xml")
-        home = ET.fromstring(zip.read("Home.xml"))
+        home = _parse_home(zip)
+        elements = _get_elements_by_tag(home)
 
         document = FreeCAD.ActiveDocument
         if import_furnitures and (not merge_elements or not document.getObject("Baseboards")):
@@ -104,50 +173,58 @@ def import_sh3d(filename, join_walls=True, merge_elements=True, import_doors=Tru
         if import_cameras and (not merge_elements or not document.getObject("Cameras")):
             document.addObject("App::DocumentObjectGroup","Cameras")
 
+        # The meshes of both furnitures and lights are decoded in one go
+        imported_furnitures = []
+        if import_furnitures:
+            imported_furnitures.extend(elements['pieceOfFurniture'])
+        if import_lights and RENDER_AVAILABLE:
+            imported_furnitures.extend(elements['light'])
+        meshes = _get_meshes_from_models(zip, _get_models(zip, imported_furnitures))
+
         progress_callback(0, "Importing levels ...")
-        if home.findall('level'):
-            floors = _import_levels(home)
+        if elements['level']:
+            floors = _import_levels(elements)
         else:
             floors = [_create_default_floor()]
+        floor_by_id = _get_floor_by_id(floors)
 
         progress_callback(10, "Importing rooms ...")
-        _import_rooms(home, floors)
+        _import_rooms(elements, floor_by_id)
 
         progress_callback(20, "Importing walls ...")
-        _import_walls(home, floors, import_furnitures)
+        _import_walls(elements, floor_by_id, import_furnitures)
 
         progress_callback(30, "Importing doors ...")
         if import_doors:
             document.recompute()
-            _import_doors(home, floors)
+            _import_doors(elements, floor_by_id)
 
         progress_callback(40, "Importing furnitues ...")
         if import_furnitures:
             document.recompute()
-            _import_furnitures(home, zip, floors)
+            _import_furnitures(elements, meshes, floor_by_id)
 
         progress_callback(50, "Importing lights ...")
         if import_lights:
             document.recompute()
-            _import_lights(home, zip, floors)
+            _import_lights(elements, meshes, floor_by_id)
 
         progress_callback(60, "Importing cameras ...")
         if import_cameras:
             document.recompute()
-            _import_cameras(home)
+            _import_cameras(elements)
 
         progress_callback(70, "Creating Arch::Site ...")
 
         name = home.get('name')
         building = None
-        if shoul_merge_elements:
+        if should_merge_elements:
             building = _get_element_to_merge({'id':name}, 'building')
 
         site = None
         if not building:
             building = Arch.makeBuilding(floors)
-            _add_property(building, "App::PropertyString", "shType", "The element type")
-            _add_property(building, "App::PropertyString", "id", "The element's id")
+            _add_properties(building, BUILDING_PROPERTIES)
             building.shType = 'building'
             building.id = name
             site = Arch.makeSite([ building ])
@@ -163,9 +240,10 @@ def import_sh3d(filename, join_walls=True, merge_elements=True, import_doors=Tru
 
         # TODO: Should be set only when opening a file, not when importing
         document.Label = name
-        document.CreatedBy = _get_sh3d_property(home, 'Author', '')
-        document.Comment = _get_sh3d_property(home, 'Copyright', '')
-        document.License = _get_sh3d_property(home, 'License', '')
+        properties = _get_sh3d_properties(elements)
+        document.CreatedBy = properties.get('Author', '')
+        document.Comment = properties.get('Copyright', '')
+        document.License = properties.get('License', '')
 
         progress_callback(100, "Successfully imported data.")
 
@@ -173,66 +251,161 @@ def import_sh3d(filename, join_walls=True, merge_elements=True, import_doors=Tru
         
 
     FreeCAD.activeDocument().recompute()
-    if FreeCAD.GuiUp:
+    if gui_up:
         FreeCADGui.SendMsgToActiveView("ViewFit")
 
-def _import_levels(home):
+def _throttle(func, interval):
+    """Returns a function that calls func at most once every interval.
+
+    The calls made before the interval has elapsed since the last actual
+    call are dropped. Unlike refreshing every n elements, the refresh rate
+    does not depend on how long it takes to import each element.
+
+    Args:
+        func (func): the function to throttle
+        interval (float): the minimum time between two calls, in seconds
+
+    Returns:
+        func: the throttled function
+    """
+    last_call = time.monotonic()
+    def throttled():
+        nonlocal last_call
+        now = time.monotonic()
+        if now - last_call >= interval:
+            last_call = now
+            func()
+    return throttled
+
+@contextmanager
+def _frozen_gui():
+    """Freezes the FreeCAD main window while importing.
+
+    The main window is not repainted and the 3D view animations are disabled
+    until the import is done, so that the many objects being created do not
+    trigger a redraw each time the GUI is updated.
+    """
+    if not gui_up:
+        yield
+        return
+    mw = FreeCADGui.getMainWindow()
+    view = FreeCADGui.ActiveDocument.ActiveView if FreeCADGui.ActiveDocument else None
+    animation_enabled = None
+    if hasattr(view, "isAnimationEnabled"):
+        animation_enabled = view.isAnimationEnabled()
+        view.setAnimationEnabled(False)
+    mw.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        mw.setUpdatesEnabled(True)
+        if animation_enabled is not None:
+            view.setAnimationEnabled(animation_enabled)
+
+def _parse_home(zip):
+    """Parses the Home.xml entry of the SweetHome 3D file.
+
+    The entry is streamed out of the Zip straight into the XML parser,
+    instead of being decompressed in memory as a whole first. With lxml,
+    the blank text nodes are dropped and the xml:id are not indexed, since
+    neither is used by the import. Since the file comes from the user, the
+    entities are not resolved and nothing is fetched from the network, as
+    with the standard library parser.
+
+    Args:
+        zip (ZipFile): the SweetHome 3D file
+
+    Returns:
+        Element: the root <home> element
+    """
+    parser = None
+    if LXML_AVAILABLE:
+        parser = ET.XMLParser(resolve_entities=False, no_network=True, collect_ids=False, remove_blank_text=True)
+    with zip.open("Home.xml") as home_xml:
+        return ET.parse(home_xml, parser).getroot()
+
+def _get_elements_by_tag(home):
+    """Returns the children of the home element, grouped by tag.
+
+    The home element is walked only once, instead of once per type of
+    imported element.
+
+    Args:
+        home (et.element): The root element of Home.xml
+
+    Returns:
+        defaultdict: the list of elements, keyed by tag, in document order
+    """
+    elements = defaultdict(list)
+    for element in home:
+        elements[element.tag].append(element)
+    return elements
+
+def _import_levels(elements):
     """Returns all the levels found in the file.
 
     Args:
-        home (dict): The xml to read the objects from
+        elements (dict): The imported elements, see _get_elements_by_tag
 
     Returns:
         list: the list of imported floors
     """
-    return list(map(_import_level, enumerate(home.findall('level'))))
+    return [_import_level(imported_level) for imported_level in elements['level']]
 
-def _import_level(imported_tuple):
+LEVEL_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The floor's id"),
+    ("App::PropertyFloat", "floorThickness", "The floor's slab thickness"),
+    ("App::PropertyInteger", "elevationIndex", "The floor number"),
+    ("App::PropertyBool", "viewable", "Whether the floor is viewable"),
+)
+
+def _import_level(imported_level):
     """Creates and returns a Arch::Floor from the imported_level object
 
     Args:
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        imported_level (Element): the xml element containg the
+            characteristics of the new object
 
     Returns:
         Arc::Floor: the newly created object
     """
-    (i, imported_level) = imported_tuple
-
     floor = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         floor = _get_element_to_merge(imported_level, 'level')
 
     if not floor:
         floor = Arch.makeFloor()
-    floor.Label = imported_level.get('name')
-    floor.Placement.Base.z = _dim_sh2fc(float(imported_level.get('elevation')))
-    floor.Height = _dim_sh2fc(float(imported_level.get('height')))
+    attributes = imported_level.attrib
+    floor.Label = attributes.get('name')
+    floor.Placement.Base.z = _dim_sh2fc(float(attributes.get('elevation')))
+    floor.Height = _dim_sh2fc(float(attributes.get('height')))
 
     #floor.setExpression("OverallWidth", "Length.Value")
 
-    _add_property(floor, "App::PropertyString", "shType", "The element type")
-    _add_property(floor, "App::PropertyString", "id", "The floor's id")
-    _add_property(floor, "App::PropertyFloat", "floorThickness", "The floor's slab thickness")
-    _add_property(floor, "App::PropertyInteger", "elevationIndex", "The floor number")
-    _add_property(floor, "App::PropertyBool", "viewable", "Whether the floor is viewable")
+    _add_properties(floor, LEVEL_PROPERTIES)
 
     floor.shType         = 'level'
-    floor.id             = imported_level.get('id')
-    floor.floorThickness = _dim_sh2fc(float(imported_level.get('floorThickness')))
-    floor.elevationIndex = int(imported_level.get('elevationIndex', 0))
-    floor.ViewObject.Visibility = imported_level.get('visible', 'false') == 'true'
+    floor.id             = attributes.get('id')
+    floor.floorThickness = _dim_sh2fc(float(attributes.get('floorThickness')))
+    floor.elevationIndex = int(attributes.get('elevationIndex', 0))
+    if gui_up:
+        floor.ViewObject.Visibility = _get_bool(attributes, 'visible', False)
 
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
-        FreeCADGui.SendMsgToActiveView("ViewFit")
+    update_gui()
 
     return floor
 
+DEFAULT_FLOOR_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The floor id"),
+    ("App::PropertyFloat", "floorThickness", "The floor's slab thickness"),
+)
+
 def _create_default_floor():
 
     default_floor = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         default_floor = _get_element_to_merge({'id':"default-floor"}, 'level')
 
     if not default_floor:
@@ -242,9 +415,7 @@ def _create_default_floor():
     default_floor.Placement.Base.z = 0
     default_floor.Height = 2500
 
-    _add_property(default_floor, "App::PropertyString", "shType", "The element type")
-    _add_property(default_floor, "App::PropertyString", "id", "The floor id")
-    _add_property(default_floor, "App::PropertyFloat", "floorThickness", "The floor's slab thickness")
+    _add_properties(default_floor, DEFAULT_FLOOR_PROPERTIES)
 
     default_floor.shType         = 'level'
     default_floor.id             = "default-floor"
@@ -252,56 +423,126 @@ def _create_default_floor():
 
     return default_floor
 
-def _get_floor(floors, level_id):
+def _get_floor_by_id(floors):
+    """Returns the imported levels keyed by their @id.
+
+    The first level is also stored under the None key. It is the level of
+    the elements without a level, see _get_floor_from_id.
+
+    Args:
+        floors (list): The list of imported levels
+
+    Returns:
+        dict: the levels, keyed by their @id
+    """
+    floor_by_id = {floor.id: floor for floor in floors}
+    floor_by_id[None] = floors[0]
+    return floor_by_id
+
+def _get_floor_from_id(floor_by_id, level_id):
     """Returns the Floor associated with the level_id.
 
-    Returns the first level if there is just one level.
+    Returns the first level if the element has no level_id. An unknown
+    level_id is reported before falling back to the first level.
 
     Args:
-        levels (list): The list of imported levels
+        floor_by_id (dict): The imported levels, see _get_floor_by_id
         level_id (string): the level @id
 
     Returns:
         level: The level
     """
-    if len(floors) == 1 or not level_id:
-        return floors[0]
-    return dict(map(lambda f: (f.id, f), floors))[level_id]
+    if not level_id:
+        return floor_by_id[None]
+    floor = floor_by_id.get(level_id)
+    if floor is None:
+        FreeCAD.Console.PrintWarning(f"Unknown level {level_id}. Defaulting to the first level\n")
+        return floor_by_id[None]
+    return floor
+
+def _get_floors_from_ids(floor_by_id, imported_elements):
+    """Returns the Floor of each imported element.
+
+    The floor of each element is resolved once, and then used both to create
+    the element and to add it to its floor, see _add_to_floors.
+
+    Args:
+        floor_by_id (dict): The imported levels, see _get_floor_by_id
+        imported_elements (list): the xml elements referencing a level
+
+    Returns:
+        list: the level of each element
+    """
+    return [_get_floor_from_id(floor_by_id, imported_element.get('level')) for imported_element in imported_elements]
 
-def _import_rooms(home, floors):
+def _add_to_floors(floors, objects):
+    """Adds each object to its floor.
+
+    The objects are grouped by floor first, so that each floor's Group is
+    only updated once instead of once per object.
+
+    Args:
+        floors (list): the floor of each object, see _get_floors_from_ids
+        objects (list): the objects to add to the floors
+    """
+    per_floor_objects = {}
+    for floor, obj in zip(floors, objects):
+        per_floor_objects.setdefault(floor.Name, (floor, []))[1].append(obj)
+    for floor, floor_objects in per_floor_objects.values():
+        floor.addObjects(floor_objects)
+
+def _import_rooms(elements, floor_by_id):
     """Returns all the rooms found in the file.
 
     Args:
-        home (dict): The xml to read the objects from
+        elements (dict): The imported elements, see _get_elements_by_tag
+        floor_by_id (dict): The imported levels, see _get_floor_by_id
 
     Returns:
         list: the list of imported rooms
     """
-    return list(map(partial(_import_room, floors), enumerate(home.findall('room'))))
-
-def _import_room(floors, imported_tuple):
+    imported_rooms = elements['room']
+    floors = _get_floors_from_ids(floor_by_id, imported_rooms)
+    rooms = [_import_room(floor, imported_room) for floor, imported_room in zip(floors, imported_rooms)]
+    _add_to_floors(floors, rooms)
+    return rooms
+
+ROOM_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The slab's id"),
+    ("App::PropertyFloat", "nameAngle", "The room's name angle"),
+    ("App::PropertyFloat", "nameXOffset", "The room's name x offset"),
+    ("App::PropertyFloat", "nameYOffset", "The room's name y offset"),
+    ("App::PropertyBool", "areaVisible", "Whether the area of the room is displayed in the plan view"),
+    ("App::PropertyFloat", "areaAngle", "The room's area annotation angle"),
+    ("App::PropertyFloat", "areaXOffset", "The room's area annotation x offset"),
+    ("App::PropertyFloat", "areaYOffset", "The room's area annotation y offset"),
+    ("App::PropertyBool", "floorVisible", "Whether the floor of the room is displayed"),
+    ("App::PropertyString", "floorColor", "The room's floor color"),
+    ("App::PropertyFloat", "floorShininess", "The room's floor shininess"),
+    ("App::PropertyBool", "ceilingVisible", "Whether the ceiling of the room is displayed"),
+    ("App::PropertyString", "ceilingColor", "The room's ceiling color"),
+    ("App::PropertyFloat", "ceilingShininess", "The room's ceiling shininess"),
+    ("App::PropertyBool", "ceilingFlat", ""),
+)
+
+def _import_room(floor, imported_room):
     """Creates and returns a Arch::Structure from the imported_room object
 
     Args:
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        floor (Arch::Floor): the level of the room
+        imported_room (Element): the xml element containg the
+            characteristics of the new object
 
     Returns:
         Arc::Structure: the newly created object
     """
-    (i, imported_room) = imported_tuple
-    floor = _get_floor(floors, imported_room.get('level'))
-
     pl = FreeCAD.Placement()
-    points = []
-    for point in imported_room.findall('point'):
-        x = float(point.get('x'))
-        y = float(point.get('y'))
-        z = _dim_fc2sh(floor.Placement.Base.z)
-        points.append(_coord_sh2fc(FreeCAD.Vector(x, y, z)))
+    xy = _get_floats(POINT_PATH(imported_room), ('x', 'y'))
+    points = _points_sh2fc(xy, _dim_fc2sh(floor.Placement.Base.z))
 
     slab = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         slab = _get_element_to_merge(imported_room, 'room')
 
     if not slab:
@@ -312,128 +553,119 @@ def _import_room(floors, imported_tuple):
     slab.IfcType = "Slab"
     slab.Normal = FreeCAD.Vector(0,0,-1)
 
-    pref = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/SH3D")
-    defaultFloorColor = pref.GetString("defaultFloorColor", 'FF96A9BA')
-
-    _set_color_and_transparency(slab, imported_room.get('floorColor', defaultFloorColor))
+    _set_color_and_transparency(slab, imported_room.get('floorColor', default_floor_color))
     # ceilingColor is not imported in the model as it depends on the upper room
 
-    _add_property(slab, "App::PropertyString", "shType", "The element type")
-    _add_property(slab, "App::PropertyString", "id", "The slab's id")
-    _add_property(slab, "App::PropertyFloat", "nameAngle", "The room's name angle")
-    _add_property(slab, "App::PropertyFloat", "nameXOffset", "The room's name x offset")
-    _add_property(slab, "App::PropertyFloat", "nameYOffset", "The room's name y offset")
-    _add_property(slab, "App::PropertyBool", "areaVisible", "Whether the area of the room is displayed in the plan view")
-    _add_property(slab, "App::PropertyFloat", "areaAngle", "The room's area annotation angle")
-    _add_property(slab, "App::PropertyFloat", "areaXOffset", "The room's area annotation x offset")
-    _add_property(slab, "App::PropertyFloat", "areaYOffset", "The room's area annotation y offset")
-    _add_property(slab, "App::PropertyBool", "floorVisible", "Whether the floor of the room is displayed")
-    _add_property(slab, "App::PropertyString", "floorColor", "The room's floor color")
-    _add_property(slab, "App::PropertyFloat", "floorShininess", "The room's floor shininess")
-    _add_property(slab, "App::PropertyBool", "ceilingVisible", "Whether the ceiling of the room is displayed")
-    _add_property(slab, "App::PropertyString", "ceilingColor", "The room's ceiling color")
-    _add_property(slab, "App::PropertyFloat", "ceilingShininess", "The room's ceiling shininess")
-    _add_property(slab, "App::PropertyBool", "ceilingFlat", "")
+    _add_properties(slab, ROOM_PROPERTIES)
 
+    attributes = imported_room.attrib
     slab.shType = 'room'
-    slab.id = imported_room.get('id', str(uuid.uuid4()))
-    slab.nameAngle = float(imported_room.get('nameAngle', 0))
-    slab.nameXOffset = float(imported_room.get('nameXOffset', 0))
-    slab.nameYOffset = float(imported_room.get('nameYOffset', -400))
-    slab.areaVisible = bool(imported_room.get('areaVisible', False))
-    slab.areaAngle = float(imported_room.get('areaAngle', 0))
-    slab.areaXOffset = float(imported_room.get('areaXOffset', 0))
-    slab.areaYOffset = float(imported_room.get('areaYOffset', 0))
-    slab.floorVisible = bool(imported_room.get('floorVisible', True))
-    slab.floorColor = str(imported_room.get('floorColor', 'FF96A9BA'))
-    slab.floorShininess = float(imported_room.get('floorShininess', 0))
-    slab.ceilingVisible = bool(imported_room.get('ceilingVisible', True))
-    slab.ceilingColor = str(imported_room.get('ceilingColor', 'FF000000'))
-    slab.ceilingShininess = float(imported_room.get('ceilingShininess', 0))
-    slab.ceilingFlat = bool(imported_room.get('ceilingFlat', False))
-
-    floor.addObject(slab)
-
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
-        FreeCADGui.SendMsgToActiveView("ViewFit")
+    slab.id = attributes.get('id', str(uuid.uuid4()))
+    slab.nameAngle = _get_float(attributes, 'nameAngle', 0)
+    slab.nameXOffset = _get_float(attributes, 'nameXOffset', 0)
+    slab.nameYOffset = _get_float(attributes, 'nameYOffset', -400)
+    slab.areaVisible = _get_bool(attributes, 'areaVisible', False)
+    slab.areaAngle = _get_float(attributes, 'areaAngle', 0)
+    slab.areaXOffset = _get_float(attributes, 'areaXOffset', 0)
+    slab.areaYOffset = _get_float(attributes, 'areaYOffset', 0)
+    slab.floorVisible = _get_bool(attributes, 'floorVisible', True)
+    slab.floorColor = attributes.get('floorColor', 'FF96A9BA')
+    slab.floorShininess = _get_float(attributes, 'floorShininess', 0)
+    slab.ceilingVisible = _get_bool(attributes, 'ceilingVisible', True)
+    slab.ceilingColor = attributes.get('ceilingColor', 'FF000000')
+    slab.ceilingShininess = _get_float(attributes, 'ceilingShininess', 0)
+    slab.ceilingFlat = _get_bool(attributes, 'ceilingFlat', False)
+
+    update_gui()
 
     return slab
 
-def _import_walls(home, floors, import_baseboards):
+def _import_walls(elements, floor_by_id, import_baseboards):
     """Returns the list of imported walls
 
     Args:
-        home (dict): The xml to read the objects from
-        floors (list): The list of floor each wall references
+        elements (dict): The imported elements, see _get_elements_by_tag
+        floor_by_id (dict): The imported levels, see _get_floor_by_id
         import_baseboards (bool): whether baseboard should also be imported
 
     Returns:
         list: the list of imported walls
     """
-    return list(map(partial(_import_wall, floors, import_baseboards), enumerate(home.findall('wall'))))
+    imported_walls = elements['wall']
+    # The end points of all the walls are converted to FC coordinates at once
+    walls_xy = _xy_sh2fc(_get_floats(imported_walls, ('xStart', 'yStart', 'xEnd', 'yEnd')).reshape(-1, 2, 2))
+    floors = _get_floors_from_ids(floor_by_id, imported_walls)
+    walls = [
+        _import_wall(floor, imported_wall, wall_xy)
+        for floor, imported_wall, wall_xy in zip(floors, imported_walls, walls_xy)
+    ]
+    _add_to_floors(floors, walls)
 
-def _import_wall(floors, import_baseboards, imported_tuple):
+    # The baseboards need the shape of their wall. The document is thus
+    # recomputed once, after all the walls have been created.
+    if import_baseboards and any(BASEBOARD_PATH(imported_wall) for imported_wall in imported_walls):
+        FreeCAD.ActiveDocument.recompute()
+        baseboards = []
+        for wall, imported_wall in zip(walls, imported_walls):
+            baseboards.extend(_import_baseboards(wall, imported_wall))
+        FreeCAD.ActiveDocument.Baseboards.addObjects(baseboards)
+    return walls
+
+WALL_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The wall's id"),
+    ("App::PropertyString", "wallAtStart", "The Id of the contiguous wall at the start of this wall"),
+    ("App::PropertyString", "wallAtEnd", "The Id of the contiguous wall at the end of this wall"),
+    ("App::PropertyString", "pattern", "The pattern of this wall in plan view"),
+    ("App::PropertyFloat", "leftSideShininess", "The wall's left hand side shininess"),
+    ("App::PropertyFloat", "rightSideShininess", "The wall's right hand side shininess"),
+)
+
+def _import_wall(floor, imported_wall, wall_xy):
     """Creates and returns a Arch::Structure from the imported_wall object
 
     Args:
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        floor (Arch::Floor): the level of the wall
+        imported_wall (Element): the xml element containg the
+            characteristics of the new object
+        wall_xy (numpy.ndarray): the FC x, y coordinates of the wall's start
+            and end points
 
     Returns:
         Arc::Structure: the newly created object
     """
-    (i, imported_wall) = imported_tuple
-
-    floor = _get_floor(floors, imported_wall.get('level'))
-
     wall = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         wall = _get_element_to_merge(imported_wall, 'wall')
 
     invert_angle = False
     if not wall:
         if imported_wall.get('arcExtent'):
-            wall, invert_angle = _make_arqued_wall(floor, imported_wall)
+            wall, invert_angle = _make_arqued_wall(floor, imported_wall, wall_xy)
         elif imported_wall.get('heightAtEnd'):
-            wall = _make_tappered_wall(floor, imported_wall)
+            wall = _make_tappered_wall(floor, imported_wall, wall_xy)
         else:
-            wall = _make_straight_wall(floor, imported_wall)
+            wall = _make_straight_wall(floor, imported_wall, wall_xy)
 
     _set_wall_colors(wall, imported_wall, invert_angle)
     wall.IfcType = "Wall"
 
-    _add_property(wall, "App::PropertyString", "shType", "The element type")
-    _add_property(wall, "App::PropertyString", "id", "The wall's id")
-    _add_property(wall, "App::PropertyString", "wallAtStart", "The Id of the contiguous wall at the start of this wall")
-    _add_property(wall, "App::PropertyString", "wallAtEnd", "The Id of the contiguous wall at the end of this wall")
-    _add_property(wall, "App::PropertyString", "pattern", "The pattern of this wall in plan view")
-    _add_property(wall, "App::PropertyFloat", "leftSideShininess", "The wall's left hand side shininess")
-    _add_property(wall, "App::PropertyFloat", "rightSideShininess", "The wall's right hand side shininess")
+    _add_properties(wall, WALL_PROPERTIES)
 
+    attributes = imported_wall.attrib
     wall.shType = 'wall'
-    wall.id = imported_wall.get('id')
-    wall.wallAtStart = imported_wall.get('wallAtStart', '')
-    wall.wallAtEnd = imported_wall.get('wallAtEnd', '')
-    wall.pattern = imported_wall.get('pattern', '')
-    wall.leftSideShininess = float(imported_wall.get('leftSideShininess', 0))
-    wall.rightSideShininess = float(imported_wall.get('rightSideShininess', 0))
-
-    floor.addObject(wall)
-
-    if import_baseboards:
-        FreeCAD.ActiveDocument.recompute()
-        baseboards = _import_baseboards(wall, imported_wall)
-        if len(baseboards):
-            FreeCAD.ActiveDocument.Baseboards.addObjects(baseboards)
+    wall.id = attributes.get('id')
+    wall.wallAtStart = attributes.get('wallAtStart', '')
+    wall.wallAtEnd = attributes.get('wallAtEnd', '')
+    wall.pattern = attributes.get('pattern', '')
+    wall.leftSideShininess = _get_float(attributes, 'leftSideShininess', 0)
+    wall.rightSideShininess = _get_float(attributes, 'rightSideShininess', 0)
 
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
-        FreeCADGui.SendMsgToActiveView("ViewFit")
+    update_gui()
 
     return wall
 
-def _make_straight_wall(floor, imported_wall):
+def _make_straight_wall(floor, imported_wall, wall_xy):
     """Create a Arch Wall from a line.
 
     The constructed wall will be a simple solid with the length width height found in imported_wall
@@ -441,74 +673,64 @@ def _make_straight_wall(floor, imported_wall):
     Args:
         floor (Arch::Structure): The floor the wall belongs to
         imported_wall (dict): the imported wall
+        wall_xy (numpy.ndarray): the FC x, y coordinates of the wall's start
+            and end points
 
     Returns:
         Arch::Wall: the newly created wall
     """
-    x_start = float(imported_wall.get('xStart'))
-    y_start = float(imported_wall.get('yStart'))
-    z_start = _dim_fc2sh(floor.Placement.Base.z)
-    x_end = float(imported_wall.get('xEnd'))
-    y_end = float(imported_wall.get('yEnd'))
-
     pl = FreeCAD.Placement()
-    points = [
-        _coord_sh2fc(FreeCAD.Vector(x_start, y_start, z_start)),
-        _coord_sh2fc(FreeCAD.Vector(x_end, y_end, z_start))
-    ]
+    z = floor.Placement.Base.z
+    points = [FreeCAD.Vector(x, y, z) for x, y in wall_xy.tolist()]
     line = Draft.make_wire(points, placement=pl, closed=False, face=True, support=None)
     wall = Arch.makeWall(line)
 
     #wall.setExpression('Height', f"<<{floor}>>.height")
     wall.Height = _dim_sh2fc(imported_wall.get('height', _dim_fc2sh(floor.Height)))
     wall.Width = _dim_sh2fc(imported_wall.get('thickness'))
-    wall.Normal = FreeCAD.Vector(0, 0, 1)
+    wall.Normal = Z_AXIS
     return wall
 
-def _make_tappered_wall(floor, imported_wall):
+def _make_tappered_wall(floor, imported_wall, wall_xy):
     #
     # We draw the vertical profile of the wall and then we extrude the
     # resulting shape. Finally we transform this shape into an Arch::Wall
+    # NOTE: wall_xy is already in FC coordinates, see _import_walls
     #
-    x_start = float(imported_wall.get('xStart'))
-    y_start = float(imported_wall.get('yStart'))
-    x_end = float(imported_wall.get('xEnd'))
-    y_end = float(imported_wall.get('yEnd'))
-    z = _dim_fc2sh(floor.Placement.Base.z)
+    (x_start, y_start), (x_end, y_end) = wall_xy.tolist()
+    z = floor.Placement.Base.z
 
     height_at_start = float(imported_wall.get('height', _dim_fc2sh(floor.Height)))
     height_at_end = float(imported_wall.get('heightAtEnd', height_at_start))
 
     points = [
-        _coord_sh2fc(FreeCAD.Vector(x_start, y_start, z)),
-        _coord_sh2fc(FreeCAD.Vector(x_end, y_end, z)),
-        _coord_sh2fc(FreeCAD.Vector(x_end, y_end, z+height_at_end)),
-        _coord_sh2fc(FreeCAD.Vector(x_start, y_start, z+height_at_start)),
+        FreeCAD.Vector(x_start, y_start, z),
+        FreeCAD.Vector(x_end, y_end, z),
+        FreeCAD.Vector(x_end, y_end, z + height_at_end*FACTOR),
+        FreeCAD.Vector(x_start, y_start, z + height_at_start*FACTOR),
     ]
     profile = Draft.make_wire(points, closed=True, face=True)
     width = _dim_sh2fc(imported_wall.get('thickness'))
     extrusion = FreeCAD.ActiveDocument.addObject('Part::Extrusion', imported_wall.get('id'))
     extrusion.Base = profile
     extrusion.DirMode = "Custom"
-    extrusion.Dir = WorkingPlane.DraftGeomUtils.getNormal(points)
+    # The profile is vertical, its normal is thus the horizontal normal of
+    # the wall's line. The extrusion is symmetric, the orientation does not
+    # matter.
+    extrusion.Dir = FreeCAD.Vector(y_start - y_end, x_end - x_start, 0).normalize()
     extrusion.LengthFwd = width
     extrusion.Symmetric = True
     profile.Visibility = False
     wall = Arch.makeWall(extrusion)
     return wall
 
-def _make_arqued_wall(floor, imported_wall):
-
-    x1 = float(imported_wall.get('xStart'))
-    y1 = float(imported_wall.get('yStart'))
-    x2 = float(imported_wall.get('xEnd'))
-    y2 = float(imported_wall.get('yEnd'))
-    z = _dim_fc2sh(floor.Placement.Base.z)
+def _make_arqued_wall(floor, imported_wall, wall_xy):
 
     # p1 and p2 are the points at which the arc should pass, i.e. the center
     #   of the edge used to draw the rectangle (used later on as sections)
-    p1 = _coord_sh2fc(FreeCAD.Vector(x1, y1, z))
-    p2 = _coord_sh2fc(FreeCAD.Vector(x2, y2, z))
+    # NOTE: wall_xy is already in FC coordinates, see _import_walls
+    z = floor.Placement.Base.z
+    p1, p2 = [FreeCAD.Vector(x, y, z) for x, y in wall_xy.tolist()]
 
     thickness = _dim_sh2fc(imported_wall.get('thickness'))
     arc_extent = _ang_sh2fc(imported_wall.get('arcExtent', 0))
@@ -540,8 +762,8 @@ def _make_arqued_wall(floor, imported_wall):
     # a1 and a2 are the angle between each etremity radius and the unit vector
     #   they are used to determine the rotation for the section used to draw
     #   the wall.
-    a1 = math.degrees(DraftVecUtils.angle(FreeCAD.Vector(1,0,0), radius1))
-    a2 = math.degrees(DraftVecUtils.angle(FreeCAD.Vector(1,0,0), radius2))
+    a1 = math.degrees(DraftVecUtils.angle(X_AXIS, radius1))
+    a2 = math.degrees(DraftVecUtils.angle(X_AXIS, radius2))
 
     if DEBUG:
         p1C1p2 = numpy.sign(DraftVecUtils.angle(p1-circles[0].Center, p2-circles[0].Center))
@@ -567,56 +789,9 @@ def _make_arqued_wall(floor, imported_wall):
         section1.ViewObject.LineColor = DEBUG_COLOR
         section2.ViewObject.LineColor = DEBUG_COLOR
 
-        origin = FreeCAD.Vector(0,0,0)
         g = FreeCAD.ActiveDocument.addObject("App::DocumentObjectGroup", imported_wall.get('id'))
-
-        def _debug_transformation(label, center, thickness, height, angle, point):
-            p = Draft.make_point(center.x, center.y, center.z, color=DEBUG_COLOR, name=f"C{label}", point_size=5)
-            g.addObject(p)
-
-            p = Draft.make_point(point.x, point.y, point.z, color=DEBUG_COLOR, name=f"P{label}", point_size=5)
-            g.addObject(p)
-
-            l = Draft.make_wire([origin,point])
-            l.ViewObject.LineColor = DEBUG_COLOR
-            l.Label = f"O-P{label}"
-            g.addObject(l)
-
-            s = Draft.make_rectangle(thickness, height)
-            s.ViewObject.LineColor = DEBUG_COLOR
-            s.Label = f"O-S{label}"
-            g.addObject(s)
-
-            r = FreeCAD.Rotation(0, 0, 0)
-            p = FreeCAD.Placement(origin, r) * p_corner
-            s = Draft.make_rectangle(thickness, height, p)
-            s.ViewObject.LineColor = DEBUG_COLOR
-            s.Label = f"O-S{label}-(corner)"
-            g.addObject(s)
-
-            r = FreeCAD.Rotation(angle, 0, 0)
-            p = FreeCAD.Placement(origin, r) * p_corner
-            s = Draft.make_rectangle(thickness, height, p)
-            s.ViewObject.LineColor = DEBUG_COLOR
-            s.Label = f"O-S{label}-(corner+a{label})"
-            g.addObject(s)
-
-            r = FreeCAD.Rotation(angle, 0, 90)
-            p = FreeCAD.Placement(origin, r) * p_corner
-            s = Draft.make_rectangle(thickness, height, p)
-            s.ViewObject.LineColor = DEBUG_COLOR
-            s.Label = f"O-S{label}-(corner+a{label}+90)"
-            g.addObject(s)
-
-            r = FreeCAD.Rotation(angle, 0, 90)
-            p = FreeCAD.Placement(point, r) * p_corner
-            s = Draft.make_rectangle(thickness, height, p)
-            s.ViewObject.LineColor = DEBUG_COLOR
-            s.Label = f"P{label}-S{label}-(corner+a{label}+90)"
-            g.addObject(s)
-
-        _debug_transformation("1", circles[0].Center, thickness, height1, a1, p1)
-        _debug_transformation("2", circles[1].Center, thickness, height2, a2, p2)
+        _debug_transformation(g, "1", circles[0].Center, thickness, height1, a1, p1, p_corner)
+        _debug_transformation(g, "2", circles[1].Center, thickness, height2, a2, p2, p_corner)
 
     # Create the spine
     placement = FreeCAD.Placement(center, FreeCAD.Rotation())
@@ -636,24 +811,87 @@ def _make_arqued_wall(floor, imported_wall):
     wall = Arch.makeWall(feature)
     return wall, invert_angle
 
+def _debug_transformation(g, label, center, thickness, height, angle, point, p_corner):
+    """Draws the intermediate steps used to place an arqued wall section.
+
+    Does nothing unless DEBUG is enabled.
+
+    Args:
+        g (App::DocumentObjectGroup): the group to add the debug objects to
+        label (str): the label of the section
+        center (FreeCAD.Vector): the center of the circle
+        thickness (float): the thickness of the wall
+        height (float): the height of the section
+        angle (float): the angle of the section
+        point (FreeCAD.Vector): the point at which the section is placed
+        p_corner (FreeCAD.Placement): the placement of the section's corner
+    """
+    if not DEBUG:
+        return
+    origin = FreeCAD.Vector(0,0,0)
+
+    p = Draft.make_point(center.x, center.y, center.z, color=DEBUG_COLOR, name=f"C{label}", point_size=5)
+    g.addObject(p)
+
+    p = Draft.make_point(point.x, point.y, point.z, color=DEBUG_COLOR, name=f"P{label}", point_size=5)
+    g.addObject(p)
+
+    l = Draft.make_wire([origin,point])
+    l.ViewObject.LineColor = DEBUG_COLOR
+    l.Label = f"O-P{label}"
+    g.addObject(l)
+
+    s = Draft.make_rectangle(thickness, height)
+    s.ViewObject.LineColor = DEBUG_COLOR
+    s.Label = f"O-S{label}"
+    g.addObject(s)
+
+    r = FreeCAD.Rotation(0, 0, 0)
+    p = FreeCAD.Placement(origin, r) * p_corner
+    s = Draft.make_rectangle(thickness, height, p)
+    s.ViewObject.LineColor = DEBUG_COLOR
+    s.Label = f"O-S{label}-(corner)"
+    g.addObject(s)
+
+    r = FreeCAD.Rotation(angle, 0, 0)
+    p = FreeCAD.Placement(origin, r) * p_corner
+    s = Draft.make_rectangle(thickness, height, p)
+    s.ViewObject.LineColor = DEBUG_COLOR
+    s.Label = f"O-S{label}-(corner+a{label})"
+    g.addObject(s)
+
+    r = FreeCAD.Rotation(angle, 0, 90)
+    p = FreeCAD.Placement(origin, r) * p_corner
+    s = Draft.make_rectangle(thickness, height, p)
+    s.ViewObject.LineColor = DEBUG_COLOR
+    s.Label = f"O-S{label}-(corner+a{label}+90)"
+    g.addObject(s)
+
+    r = FreeCAD.Rotation(angle, 0, 90)
+    p = FreeCAD.Placement(point, r) * p_corner
+    s = Draft.make_rectangle(thickness, height, p)
+    s.ViewObject.LineColor = DEBUG_COLOR
+    s.Label = f"P{label}-S{label}-(corner+a{label}+90)"
+    g.addObject(s)
+
 def _set_wall_colors(wall, imported_wall, invert_angle):
-    # The default color of the wall
-    pref = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/SH3D")
-    defaultWallColor = pref.GetString("DefaultWallColor", 'FF96A9BA')
-    topColor = imported_wall.get('topColor', defaultWallColor)
+    if not gui_up:
+        return
+    attributes = imported_wall.attrib
+    topColor = attributes.get('topColor', default_wall_color)
     _set_color_and_transparency(wall, topColor)
-    leftSideColor = _hex2rgb(imported_wall.get('leftSideColor', topColor))
-    rightSideColor = _hex2rgb(imported_wall.get('rightSideColor', topColor))
+    leftSideColor = _hex2rgb(attributes.get('leftSideColor', topColor))
+    rightSideColor = _hex2rgb(attributes.get('rightSideColor', topColor))
     topColor = _hex2rgb(topColor)
 
     # Unfortunately all faces are not defined the same way for all the wall.
     # It depends on the type of wall :o
-    if imported_wall.get('arcExtent'):
+    if attributes.get('arcExtent'):
         if invert_angle:
             colors = [topColor, rightSideColor, topColor, leftSideColor, topColor, topColor]
         else:
             colors = [topColor, leftSideColor, topColor, rightSideColor, topColor, topColor]
-    elif imported_wall.get('heightAtEnd'):
+    elif attributes.get('heightAtEnd'):
         colors = [topColor, topColor, topColor, topColor, rightSideColor, leftSideColor]
     else:
         colors = [leftSideColor, topColor, rightSideColor, topColor, topColor, topColor]
@@ -670,7 +908,13 @@ def _import_baseboards(wall, imported_wall):
     Returns:
         list: the list of imported baseboards
     """
-    return list(map(partial(_import_baseboard, wall), imported_wall.findall('baseboard')))
+    return [_import_baseboard(wall, imported_baseboard) for imported_baseboard in BASEBOARD_PATH(imported_wall)]
+
+BASEBOARD_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The element's id"),
+    ("App::PropertyLink", "parent", "The element parent"),
+)
 
 def _import_baseboard(wall, imported_baseboard):
     """Creates and returns a Part::Extrusion from the imported_baseboard object
@@ -709,7 +953,7 @@ def _import_baseboard(wall, imported_baseboard):
 
     baseboard_id = f"{wall.id}-{side}"
     baseboard = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         baseboard = _get_element_to_merge({'id':baseboard_id}, 'baseboard')
 
     if not baseboard:
@@ -721,7 +965,7 @@ def _import_baseboard(wall, imported_baseboard):
         baseboard.Base = base
 
     baseboard.DirMode = "Custom"
-    baseboard.Dir = FreeCAD.Vector(0, 0, 1)
+    baseboard.Dir = Z_AXIS
     baseboard.DirLink = None
     baseboard.LengthFwd = baseboard_height
     baseboard.LengthRev = 0
@@ -733,9 +977,7 @@ def _import_baseboard(wall, imported_baseboard):
 
     _set_color_and_transparency(baseboard, imported_baseboard.get('color'))
 
-    _add_property(baseboard, "App::PropertyString", "shType", "The element type")
-    _add_property(baseboard, "App::PropertyString", "id", "The element's id")
-    _add_property(baseboard, "App::PropertyLink", "parent", "The element parent")
+    _add_properties(baseboard, BASEBOARD_PROPERTIES)
 
     baseboard.shType = 'baseboard'
     baseboard.id = baseboard_id
@@ -743,126 +985,153 @@ def _import_baseboard(wall, imported_baseboard):
 
     return baseboard
 
-def _import_doors(home, floors):
+def _import_doors(elements, floor_by_id):
     """Returns the list of imported door
 
     Args:
-        home (dict): The xml to read the objects from
+        elements (dict): The imported elements, see _get_elements_by_tag
+        floor_by_id (dict): The imported levels, see _get_floor_by_id
 
     Returns:
         list: the list of imported doors
     """
-    return list(map(partial(_import_door, floors), enumerate(home.findall('doorOrWindow'))))
+    imported_doors = elements['doorOrWindow']
+    placements = _get_windows_placements(floor_by_id, _get_walls_bound_boxes(), imported_doors)
+    return [
+        _import_door(imported_door, wall, placement)
+        for imported_door, (wall, placement) in zip(imported_doors, placements)
+    ]
+
+def _get_windows_placements(floor_by_id, walls, imported_doors):
+    """Returns the hosting wall and the placement of each imported door.
+
+    The window in SweetHome3D s is defined with a width, depth, height.
+    Furthermore the (x.y.z) is the center point of the lower face of the
+    window. In FC the placement is defined on the face of the whole that
+    will contain the windows. The corners and rotations of all the doors
+    are computed at once with NumPy.
+
+    Args:
+        floor_by_id (dict): the imported levels, see _get_floor_by_id
+        walls (list): the bounding box of each wall, see _get_walls_bound_boxes
+        imported_doors (list): the imported doorOrWindow elements
+
+    Returns:
+        list: a list of (wall, placement) tuples, the wall being None when
+            the door is not contained in any wall
+    """
+    xy = _get_floats(imported_doors, ('x', 'y'))
+    elevation, angle = _get_floats(imported_doors, ('elevation', 'angle'), '0').T
+    width = _get_floats(imported_doors, ('width',))[:, 0] * FACTOR
+    floor_z = numpy.array([_get_floor_from_id(floor_by_id, d.get('level')).Placement.Base.z for d in imported_doors], dtype=numpy.float64)
+
+    # These are the FC coordinates of the center point of the lower face of
+    # each window. They then need to be moved to the proper face on the wall
+    # and offset properly with respect to the wall's face.
+    centers = numpy.empty((len(imported_doors), 3))
+    centers[:, :2] = _xy_sh2fc(xy)
+    centers[:, 2] = elevation * FACTOR + floor_z
+    door_walls = _get_walls(walls, centers)
+    wall_width = numpy.array([float(wall.Width) if wall else 0.0 for wall in door_walls], dtype=numpy.float64)
+
+    # this is the vector that allow me to go from the center to the corner
+    # of the bouding box, rotated around the Z axis. Note that the angle of
+    # the rotation is negated because the y axis is reversed in SweetHome3D
+    cos = numpy.cos(-angle)
+    sin = numpy.sin(-angle)
+    corners = centers
+    corners[:, 0] += cos * (-width/2) - sin * (-wall_width/2)
+    corners[:, 1] += sin * (-width/2) + cos * (-wall_width/2)
+
+    # The rotation is the one of FreeCAD.Rotation(degrees(-angle), 0, 90),
+    # i.e. a rotation of -angle around Z after a rotation of 90° around X.
+    # Its quaternion (x, y, z, w) has the following closed form:
+    half_cos = numpy.cos(-angle/2) * math.sqrt(0.5)
+    half_sin = numpy.sin(-angle/2) * math.sqrt(0.5)
+    rotations = numpy.column_stack((half_cos, half_sin, half_sin, half_cos))
+    return [
+        (wall, FreeCAD.Placement(FreeCAD.Vector(*corner), FreeCAD.Rotation(*rotation)))
+        for wall, corner, rotation in zip(door_walls, corners.tolist(), rotations.tolist())
+    ]
 
-def _import_door(floors, imported_tuple):
+def _str2bool(value):
+    # NOTE: bool('false') is True, hence the explicit comparison. The value
+    #   is the default itself when the attribute is missing.
+    return value is True or value == 'true'
+
+DOOR_OR_WINDOW_PROPERTIES = (
+    ("App::PropertyFloat", "wallThickness", "", float, 1),
+    ("App::PropertyFloat", "wallDistance", "", float, 0),
+    ("App::PropertyFloat", "wallWidth", "", float, 1),
+    ("App::PropertyFloat", "wallLeft", "", float, 0),
+    ("App::PropertyFloat", "wallHeight", "", float, 1),
+    ("App::PropertyFloat", "wallTop", "", float, 0),
+    ("App::PropertyBool", "wallCutOutOnBothSides", "", _str2bool, True),
+    ("App::PropertyBool", "widthDepthDeformable", "", _str2bool, True),
+    ("App::PropertyString", "cutOutShape", "", str, ''),
+    ("App::PropertyBool", "boundToWall", "", _str2bool, True),
+)
+
+def _import_door(imported_door, wall, placement):
     """Creates and returns a Arch::Door from the imported_door object
 
     Args:
-        floors (list): the list of imported levels
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        imported_door (Element): the xml element containg the
+            characteristics of the new object
+        wall (Arch::Wall): the wall hosting the door, if any
+        placement (FreeCAD.Placement): the placement of the door's corner
 
     Returns:
         Arch::Door: the newly created object
     """
-    (i, imported_door) = imported_tuple
-    floor = _get_floor(floors, imported_door.get('level'))
-
     window = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         window = _get_element_to_merge(imported_door, 'doorOrWindow')
 
     if not window:
-        window = _create_window(floor, imported_door)
+        window = _create_window(wall, placement, imported_door)
         if not window:
             return None
 
     window.IfcType = "Window"
 
     _add_property(window, "App::PropertyString", "shType", "The element type")
-    _add_furniture_common_attributes(window, imported_door)
-    _add_piece_of_furniture_common_attributes(window, imported_door)
-    _add_property(window, "App::PropertyFloat", "wallThickness", "")
-    _add_property(window, "App::PropertyFloat", "wallDistance", "")
-    _add_property(window, "App::PropertyFloat", "wallWidth", "")
-    _add_property(window, "App::PropertyFloat", "wallLeft", "")
-    _add_property(window, "App::PropertyFloat", "wallHeight", "")
-    _add_property(window, "App::PropertyFloat", "wallTop", "")
-    _add_property(window, "App::PropertyBool", "wallCutOutOnBothSides", "")
-    _add_property(window, "App::PropertyBool", "widthDepthDeformable", "")
-    _add_property(window, "App::PropertyString", "cutOutShape", "")
-    _add_property(window, "App::PropertyBool", "boundToWall", "")
-
     window.shType = 'doorOrWindow'
-    window.wallThickness = float(imported_door.get('wallThickness', 1))
-    window.wallDistance = float(imported_door.get('wallDistance', 0))
-    window.wallWidth = float(imported_door.get('wallWidth', 1))
-    window.wallLeft = float(imported_door.get('wallLeft', 0))
-    window.wallHeight = float(imported_door.get('wallHeight', 1))
-    window.wallTop = float(imported_door.get('wallTop', 0))
-    window.wallCutOutOnBothSides = bool(imported_door.get('wallCutOutOnBothSides', True))
-    window.widthDepthDeformable = bool(imported_door.get('widthDepthDeformable', True))
-    window.cutOutShape = str(imported_door.get('cutOutShape', ''))
-    window.boundToWall = bool(imported_door.get('boundToWall', True))
-
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
+    _set_properties(window, imported_door, DOOR_PROPERTIES)
+
+    update_gui()
 
     return window
 
-def _create_window(floor, imported_door):
-    # The window in SweetHome3D s is defined with a width, depth, height.
-    # Furthermore the (x.y.z) is the center point of the lower face of the
-    # window. In FC the placement is defined on the face of the whole that
-    # will contain the windows. The makes this calculation rather
-    # cumbersome.
-    x_center = float(imported_door.get('x'))
-    y_center = float(imported_door.get('y'))
-    z_center = float(imported_door.get('elevation', 0))
-    z_center += _dim_fc2sh(floor.Placement.Base.z)
-
-    # This is the FC coordinate of the center point of the lower face of the
-    # window. This then needs to be moved to the proper face on the wall and
-    # offset properly with respect to the wall's face.
-    center = _coord_sh2fc(FreeCAD.Vector ( x_center, y_center, z_center ))
-
-    wall = _get_wall(center)
+# The window preset used for each known SweetHome3D catalog ID, see
+# _create_window
+CATALOG_TO_WINDOWTYPE = {
+    **dict.fromkeys(("eTeks#fixedWindow85x123", "eTeks#window85x123", "eTeks#doubleWindow126x123", "eTeks#doubleWindow126x163", "eTeks#doubleFrenchWindow126x200", "eTeks#window85x163", "eTeks#frenchWindow85x200", "eTeks#doubleHungWindow80x122", "eTeks#roundWindow", "eTeks#halfRoundWindow"), 'Open 2-pane'),
+    **dict.fromkeys(("Scopia#window_2x1_with_sliders", "Scopia#window_2x3_arched", "Scopia#window_2x4_arched", "eTeks#sliderWindow126x200"), 'Sliding 2-pane'),
+    **dict.fromkeys(("eTeks#frontDoor", "eTeks#roundedDoor", "eTeks#door", "eTeks#doorFrame", "eTeks#roundDoorFrame"), 'Simple door'),
+}
+
+def _create_window(wall, placement, imported_door):
+    # The placement of the window has already been computed, see
+    # _get_windows_placements
     if not wall:
         FreeCAD.Console.PrintWarning(f"No wall found for door {imported_door.get('id')}. Skipping!\n")
         return None
 
-    width = _dim_sh2fc(imported_door.get('width'))
-    depth = _dim_sh2fc(imported_door.get('depth'))
-    height = _dim_sh2fc(imported_door.get('height'))
-    angle = float(imported_door.get('angle',0))
-
-    # this is the vector that allow me to go from the center to the corner
-    # of the bouding box. Note that the angle of the rotation is negated
-    # because the y axis is reversed in SweetHome3D
-    center2corner = FreeCAD.Vector( -width/2, -wall.Width/2, 0 )
-    center2corner = FreeCAD.Rotation( FreeCAD.Vector(0,0,1), math.degrees(-angle) ).multVec(center2corner)
-
-    corner = center.add(center2corner)
-    pl = FreeCAD.Placement (
-        corner, # translation
-        FreeCAD.Rotation(math.degrees(-angle), 0 , 90 ),  # rotation
-        FreeCAD.Vector( 0, 0, 0 ) # rotation@coordinate
-    )
+    attributes = imported_door.attrib
+    width = float(attributes.get('width')) * FACTOR
+    depth = float(attributes.get('depth')) * FACTOR
+    height = float(attributes.get('height')) * FACTOR
 
     # NOTE: the windows are not imported as meshes, but we use a simple
     #   correspondance between a catalog ID and a specific window preset from
     #   the parts library.
     # Arch.WindowPresets =  ["Fixed", "Open 1-pane", "Open 2-pane", "Sash 2-pane", "Sliding 2-pane", "Simple door", "Glass door", "Sliding 4-pane", "Awning"]
 
-    catalog_id = imported_door.get('catalogId')
-    if catalog_id in ("eTeks#fixedWindow85x123", "eTeks#window85x123", "eTeks#doubleWindow126x123", "eTeks#doubleWindow126x163", "eTeks#doubleFrenchWindow126x200", "eTeks#window85x163", "eTeks#frenchWindow85x200", "eTeks#doubleHungWindow80x122", "eTeks#roundWindow", "eTeks#halfRoundWindow"):
-        windowtype = 'Open 2-pane'
-    elif catalog_id in ("Scopia#window_2x1_with_sliders", "Scopia#window_2x3_arched", "Scopia#window_2x4_arched", "eTeks#sliderWindow126x200"):
-        windowtype = 'Sliding 2-pane'
-    elif catalog_id in ("eTeks#frontDoor", "eTeks#roundedDoor", "eTeks#door", "eTeks#doorFrame", "eTeks#roundDoorFrame"):
-        windowtype = 'Simple door'
-    else:
-        FreeCAD.Console.PrintWarning(f"Unknown catalogId {catalog_id} for door {imported_door.get('id')}. Defaulting to 'Simple Door'\n")
+    catalog_id = attributes.get('catalogId')
+    windowtype = CATALOG_TO_WINDOWTYPE.get(catalog_id)
+    if windowtype is None:
+        FreeCAD.Console.PrintWarning(f"Unknown catalogId {catalog_id} for door {attributes.get('id')}. Defaulting to 'Simple Door'\n")
         windowtype = 'Simple door'
 
     h1 = 10
@@ -872,59 +1141,130 @@ def _create_window(floor, imported_door):
     w2 = 10
     o1 = 0
     o2 = w1 / 2
-    window = Arch.makeWindowPreset(windowtype, width=width, height=height, h1=h1, h2=h2, h3=h3, w1=w1, w2=w2, o1=o1, o2=o2, placement=pl)
+    window = Arch.makeWindowPreset(windowtype, width=width, height=height, h1=h1, h2=h2, h3=h3, w1=w1, w2=w2, o1=o1, o2=o2, placement=placement)
     window.Hosts = [wall]
     return window
 
-def _get_wall(point):
-    """Returns the wall that contains the given point.
+def _get_walls_bound_boxes():
+    """Returns the bounding box of each wall of the document.
+
+    The bounding boxes are computed once, before importing the doors, instead
+    of scanning all the document objects for each door.
+
+    Returns:
+        tuple: a (W, 6) array with the (XMin, YMin, ZMin, XMax, YMax, ZMax)
+            of each wall's bounding box, and the list of the W walls
+    """
+    walls = [object for object in FreeCAD.ActiveDocument.Objects if Draft.getType(object) == "Wall"]
+    bounds = numpy.array([
+        (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax)
+        for bb in (wall.Shape.BoundBox for wall in walls)
+    ], dtype=numpy.float64).reshape(-1, 6)
+    return bounds, walls
+
+def _get_walls(walls, points):
+    """Returns the wall that contains each of the given points.
+
+    All the points are tested against all the bounding boxes at once with
+    NumPy.
 
     Args:
-        point (FreeCAD.Vector): the point to test for
+        walls (tuple): the bounding box of each wall, see _get_walls_bound_boxes
+        points (numpy.ndarray): a (N, 3) array of the (x, y, z) points to
+            test for
 
     Returns:
-        Arch::Wall: the wall that contains the given point
+        list: the first wall that contains each point, or None if the
+            point is not contained in any wall
     """
-    for object in FreeCAD.ActiveDocument.Objects:
-        if Draft.getType(object) == "Wall":
-            bb = object.Shape.BoundBox
-            try:
-                if bb.isInside(point):
-                    return object
-            except FloatingPointError:
-                pass
-    return None
+    bounds, walls = walls
+    if not walls:
+        return [None] * len(points)
+    # inside[i, j] tells whether the i-th point is in the j-th wall
+    inside = numpy.all(
+        (bounds[None, :, :3] <= points[:, None, :]) & (points[:, None, :] <= bounds[None, :, 3:]),
+        axis=2)
+    indexes = numpy.argmax(inside, axis=1)
+    found = inside.any(axis=1)
+    return [walls[index] if is_found else None for index, is_found in zip(indexes.tolist(), found.tolist())]
+
+def _get_models(zip, imported_furnitures):
+    """Returns the name of the models referenced by the imported furnitures.
+
+    Each model is listed only once, even when it is shared by several
+    pieces of furniture. The models of the furnitures merged with an existing
+    element are not listed at all.
 
-def _import_furnitures(home, zip, floors):
-    list(map(partial(_import_furniture, zip, floors), enumerate(home.findall('pieceOfFurniture'))))
+    Args:
+        zip (ZipFile): the Zip containing the Mesh files
+        imported_furnitures (list): the elements referencing a model
+
+    Returns:
+        list: the name of the models
+
+    Raises:
+        ValueError: If a model is missing from the Zip
+    """
+    entries = set(zip.namelist())
+    models = {}
+    for imported_furniture in imported_furnitures:
+        model = imported_furniture.get('model')
+        if model in models or _get_element_to_merge(imported_furniture, 'pieceOfFurniture'):
+            continue
+        if model not in entries:
+            raise ValueError(f"Invalid SweetHome3D file: missing model {model}")
+        models[model] = True
+    return list(models)
+
+def _import_furnitures(elements, meshes, floor_by_id):
+    imported_furnitures = elements['pieceOfFurniture']
+    furnitures = [
+        _import_furniture(meshes, floor_by_id, imported_furniture)
+        for imported_furniture in imported_furnitures
+    ]
+    FreeCAD.ActiveDocument.Furnitures.addObjects(_get_created_furnitures(imported_furnitures, furnitures))
+
+def _get_created_furnitures(imported_furnitures, furnitures):
+    """Returns the furnitures that were not merged with an existing element.
+
+    The furnitures are added to their group all at once, after being
+    imported. The merged furnitures already belong to a group and are left
+    alone.
+
+    Args:
+        imported_furnitures (list): the imported xml elements
+        furnitures (list): the corresponding FC objects
 
-def _import_furniture(zip, floors, imported_tuple):
+    Returns:
+        list: the newly created furnitures
+    """
+    return [
+        furniture
+        for imported_furniture, furniture in zip(imported_furnitures, furnitures)
+        if not _get_element_to_merge(imported_furniture, 'pieceOfFurniture')
+    ]
+
+def _import_furniture(meshes, floor_by_id, imported_furniture):
     """Creates and returns a Mesh from the imported_furniture object
 
     Args:
-        zip (ZipFile): the Zip containing the Mesh file
-        floors (list): the list of imported levels
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        meshes (dict): the decoded Mesh of each model, keyed by model name
+        floor_by_id (dict): the imported levels, see _get_floor_by_id
+        imported_furniture (Element): the xml element containg the
+            characteristics of the new object
 
     Returns:
         Mesh: the newly created object
     """
-    (i, imported_furniture) = imported_tuple
-
     furniture = None
-    if shoul_merge_elements:
+    if should_merge_elements:
         furniture = _get_element_to_merge(imported_furniture, 'pieceOfFurniture')
 
     if not furniture:
-        # let's read the model first
-        model = imported_furniture.get('model')
-        if model not in zip.namelist():
-            raise ValueError(f"Invalid SweetHome3D file: missing model {model}")
         materials = _import_materials(imported_furniture)
-        mesh = _get_mesh_from_model(zip, model, materials)
-        furniture = _create_furniture(floors, imported_furniture, mesh)
-        FreeCAD.ActiveDocument.Furnitures.addObject(furniture)
+        # The mesh is transformed in place, and might be shared by others
+        mesh = meshes[imported_furniture.get('model')].copy()
+        furniture = _create_furniture(floor_by_id, imported_furniture, mesh)
 
         if "Material" not in furniture.PropertiesList and len(materials) > 0:
             furniture.addProperty(
@@ -940,211 +1280,240 @@ def _import_furniture(zip, floors, imported_tuple):
     #furniture.IfcType = "Furniture"
 
     _add_property(furniture, "App::PropertyString", "shType", "The element type")
-    _add_furniture_common_attributes(furniture, imported_furniture)
-    _add_piece_of_furniture_common_attributes(furniture, imported_furniture)
-    _add_piece_of_furniture_horizontal_rotation_attributes(furniture, imported_furniture)
-
     furniture.shType = 'pieceOfFurniture'
+    _set_properties(furniture, imported_furniture, FURNITURE_PROPERTIES)
 
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
+    update_gui()
 
     return furniture
 
-def _get_mesh_from_model(zip, model, materials):
-    model_path_obj = None
+def _get_meshes_from_models(zip, models):
+    """Returns the decoded Mesh of each model.
+
+    Since decoding a model does not touch the document, the models are
+    decoded concurrently. The document itself is only modified afterward,
+    from the main thread.
+
+    Args:
+        zip (ZipFile): the Zip containing the Mesh files
+        models (list): the name of the models to decode
+
+    Returns:
+        dict: the decoded Mesh, keyed by model name
+    """
+    tmp_dir = FreeCAD.ActiveDocument.TransientDir
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {model: executor.submit(_get_mesh_from_model, zip, tmp_dir, model) for model in models}
+    return {model: future.result() for model, future in futures.items()}
+
+def _get_mesh_from_model(zip, tmp_dir, model):
+    # Since mesh.read(model_data) does not work on BytesIO, the model is
+    # streamed to a temporary file first
+    dst = tempfile.NamedTemporaryFile(suffix=".obj", dir=tmp_dir, delete=False)
     try:
-        # Since mesh.read(model_data) does not work on BytesIO extract it first
-        tmp_dir = FreeCAD.ActiveDocument.TransientDir
-        if os.path.isdir(os.path.join(tmp_dir, model)):
-            tmp_dir = os.path.join(tmp_dir, str(uuid.uuid4()))
-        model_path = zip.extract(member=model, path=tmp_dir)
-        model_path_obj = model_path+".obj"
-        os.rename(model_path, model_path_obj)
+        with dst, zip.open(model) as src:
+            shutil.copyfileobj(src, dst, 1024*1024)
         mesh = Mesh.Mesh()
-        mesh.read(model_path_obj)
+        mesh.read(dst.name)
     finally:
-        if model_path_obj:
-            os.remove(model_path_obj)
+        os.unlink(dst.name)
     return mesh
 
-def _create_furniture(floors, imported_furniture, mesh):
+# The matrix used to transform each furniture's mesh. mesh.transform() does
+# not keep it, so a single instance is reused for all the furnitures
+FURNITURE_TRANSFORM = FreeCAD.Matrix()
+
+def _create_furniture(floor_by_id, imported_furniture, mesh):
+    attributes = imported_furniture.attrib
 
-    floor = _get_floor(floors, imported_furniture.get('level'))
+    floor = _get_floor_from_id(floor_by_id, attributes.get('level'))
 
     # REF: sweethome3d-code/SweetHome3D/src/com/eteks/sweethome3d/j3d/ModelManager.java:getPieceOfFurnitureNormalizedModelTransformation()
-    width = _dim_sh2fc(float(imported_furniture.get('width')))
-    depth = _dim_sh2fc(float(imported_furniture.get('depth')))
-    height = _dim_sh2fc(float(imported_furniture.get('height')))
-    x = float(imported_furniture.get('x',0))
-    y = float(imported_furniture.get('y',0))
-    z = float(imported_furniture.get('elevation', 0.0))
-    angle = float(imported_furniture.get('angle', 0.0))
-    pitch = float(imported_furniture.get('pitch', 0.0)) # X Axis
-    roll = float(imported_furniture.get('roll', 0.0)) # Y Axis
-    name = imported_furniture.get('name')
-    mirrored = bool(imported_furniture.get('modelMirrored', "false") == "true")
+    width = float(attributes.get('width')) * FACTOR
+    depth = float(attributes.get('depth')) * FACTOR
+    height = float(attributes.get('height')) * FACTOR
+    x = float(attributes.get('x',0))
+    y = float(attributes.get('y',0))
+    z = float(attributes.get('elevation', 0.0))
+    angle = float(attributes.get('angle', 0.0))
+    pitch = float(attributes.get('pitch', 0.0)) # X Axis
+    roll = float(attributes.get('roll', 0.0)) # Y Axis
+    name = attributes.get('name')
+    mirrored = _get_bool(attributes, 'modelMirrored', False)
 
     # The meshes are normalized, facing up.
     # Center, Scale, X Rotation && Z Rotation (in FC axes), Move
+    # The whole transformation is composed with NumPy and handed to FC at once
     bb = mesh.BoundBox
-    transform = FreeCAD.Matrix()
-    transform.move(-bb.Center)
     # NOTE: the model is facing up, thus y and z are inverted
-    transform.scale(width/bb.XLength, height/bb.YLength, depth/bb.ZLength)
-    transform.rotateX(math.pi/2)
-    transform.rotateX(-pitch)
-    transform.rotateY(roll)
-    transform.rotateZ(-angle)
-    level_elevation = _dim_fc2sh(floor.Placement.Base.z)
-    transform.move(_coord_sh2fc(FreeCAD.Vector(x, y, level_elevation + z + (_dim_fc2sh(height) / 2))))
-    mesh.transform(transform)
+    scale = numpy.array((width/bb.XLength, height/bb.YLength, depth/bb.ZLength))
+    linear = _get_furniture_rotation(pitch, roll, angle) * scale
+    move = numpy.array((x*FACTOR, -y*FACTOR, floor.Placement.Base.z + z*FACTOR + height/2))
+    move -= linear @ (bb.Center.x, bb.Center.y, bb.Center.z)
+    transform = numpy.identity(4)
+    transform[:3, :3] = linear
+    transform[:3, 3] = move
+    # NOTE: all the coefficients are overwritten, no need to reset it
+    FURNITURE_TRANSFORM.A = transform.flatten().tolist()
+    mesh.transform(FURNITURE_TRANSFORM)
 
     furniture = FreeCAD.ActiveDocument.addObject("Mesh::Feature", name)
     furniture.Mesh = mesh
     # return Arch.makeEquipment(baseobj=furniture, name=name)
     return furniture
 
-def _add_furniture_common_attributes(furniture, imported_furniture):
-    _add_property(furniture, "App::PropertyString", "id", "The furniture's id")
-    _add_property(furniture, "App::PropertyFloat", "angle", "The angle of the furniture")
-    _add_property(furniture, "App::PropertyBool", "visible", "Whether the object is visible")
-    _add_property(furniture, "App::PropertyBool", "movable", "Whether the object is movable")
-    _add_property(furniture, "App::PropertyString", "description", "The object's description")
-    _add_property(furniture, "App::PropertyString", "information", "The object's information")
-    _add_property(furniture, "App::PropertyString", "license", "The object's license")
-    _add_property(furniture, "App::PropertyString", "creator", "The object's creator")
-    _add_property(furniture, "App::PropertyBool", "modelMirrored", "Whether the object is mirrored")
-    _add_property(furniture, "App::PropertyBool", "nameVisible", "Whether the object's name is visible")
-    _add_property(furniture, "App::PropertyFloat", "nameAngle", "The object's name angle")
-    _add_property(furniture, "App::PropertyFloat", "nameXOffset", "The object's name X offset")
-    _add_property(furniture, "App::PropertyFloat", "nameYOffset", "The object's name Y offset")
-    _add_property(furniture, "App::PropertyFloat", "price", "The object's price")
-
-    furniture.id = str(imported_furniture.get('id'))
-    furniture.angle = float(imported_furniture.get('angle', 0))
-    furniture.visible = bool(imported_furniture.get('visible', True))
-    furniture.movable = bool(imported_furniture.get('movable', True))
-    furniture.description = str(imported_furniture.get('description', ''))
-    furniture.information = str(imported_furniture.get('information', ''))
-    furniture.license = str(imported_furniture.get('license', ''))
-    furniture.creator = str(imported_furniture.get('creator', ''))
-    furniture.modelMirrored = bool(imported_furniture.get('modelMirrored', False))
-    furniture.nameVisible = bool(imported_furniture.get('nameVisible', False))
-    furniture.nameAngle = float(imported_furniture.get('nameAngle', 0))
-    furniture.nameXOffset = float(imported_furniture.get('nameXOffset', 0))
-    furniture.nameYOffset = float(imported_furniture.get('nameYOffset', 0))
-    furniture.price = float(imported_furniture.get('price', 0))
-
-def _add_piece_of_furniture_common_attributes(furniture, imported_furniture):
-    _add_property(furniture, "App::PropertyString", "level", "The furniture's level")
-    _add_property(furniture, "App::PropertyString", "catalogId", "The furniture's catalog id")
-    _add_property(furniture, "App::PropertyFloat", "dropOnTopElevation", "")
-    _add_property(furniture, "App::PropertyString", "model", "The object's mesh file")
-    _add_property(furniture, "App::PropertyString", "icon", "The object's icon")
-    _add_property(furniture, "App::PropertyString", "planIcon", "The object's icon for the plan view")
-    _add_property(furniture, "App::PropertyString", "modelRotation", "The object's model rotation")
-    _add_property(furniture, "App::PropertyString", "modelCenteredAtOrigin", "The object's center")
-    _add_property(furniture, "App::PropertyBool", "backFaceShown", "Whether the object's back face is shown")
-    _add_property(furniture, "App::PropertyString", "modelFlags", "The object's flags")
-    _add_property(furniture, "App::PropertyFloat", "modelSize", "The object's size")
-    _add_property(furniture, "App::PropertyBool", "doorOrWindow", "Whether the object is a door or Window")
-    _add_property(furniture, "App::PropertyBool", "resizable", "Whether the object is resizable")
-    _add_property(furniture, "App::PropertyBool", "deformable", "Whether the object is deformable")
-    _add_property(furniture, "App::PropertyBool", "texturable", "Whether the object is texturable")
-    _add_property(furniture, "App::PropertyString", "staircaseCutOutShape", "")
-    _add_property(furniture, "App::PropertyFloat", "shininess", "The object's shininess")
-    _add_property(furniture, "App::PropertyFloat", "valueAddedTaxPercentage", "The object's VAT percentage")
-    _add_property(furniture, "App::PropertyString", "currency", "The object's price currency")
-
-    furniture.level = str(imported_furniture.get('level', ''))
-    furniture.catalogId = str(imported_furniture.get('catalogId', ''))
-    furniture.dropOnTopElevation = float(imported_furniture.get('dropOnTopElevation', 0))
-    furniture.model = str(imported_furniture.get('model', ''))
-    furniture.icon = str(imported_furniture.get('icon', ''))
-    furniture.planIcon = str(imported_furniture.get('planIcon', ''))
-    furniture.modelRotation = str(imported_furniture.get('modelRotation', ''))
-    furniture.modelCenteredAtOrigin = str(imported_furniture.get('modelCenteredAtOrigin', ''))
-    furniture.backFaceShown = bool(imported_furniture.get('backFaceShown', False))
-    furniture.modelFlags = str(imported_furniture.get('modelFlags', ''))
-    furniture.modelSize = float(imported_furniture.get('modelSize', 0))
-    furniture.doorOrWindow = bool(imported_furniture.get('doorOrWindow', False))
-    furniture.resizable = bool(imported_furniture.get('resizable', True))
-    furniture.deformable = bool(imported_furniture.get('deformable', True))
-    furniture.texturable = bool(imported_furniture.get('texturable', True))
-    furniture.staircaseCutOutShape = str(imported_furniture.get('staircaseCutOutShape', ''))
-    furniture.shininess = float(imported_furniture.get('shininess', 0))
-    furniture.valueAddedTaxPercentage = float(imported_furniture.get('valueAddedTaxPercentage', 0))
-    furniture.currency = str(imported_furniture.get('currency', 'EUR'))
-
-def _add_piece_of_furniture_horizontal_rotation_attributes(furniture, imported_furniture):
-    _add_property(furniture, "App::PropertyBool", "horizontallyRotatable", "Whether the object horizontally rotatable")
-    _add_property(furniture, "App::PropertyFloat", "pitch", "The object's pitch")
-    _add_property(furniture, "App::PropertyFloat", "roll", "The object's roll")
-    _add_property(furniture, "App::PropertyFloat", "widthInPlan", "The object's width in the plan view")
-    _add_property(furniture, "App::PropertyFloat", "depthInPlan", "The object's depth in the plan view")
-    _add_property(furniture, "App::PropertyFloat", "heightInPlan", "The object's height in the plan view")
-
-    furniture.horizontallyRotatable = bool(imported_furniture.get('horizontallyRotatable', True))
-    furniture.pitch = float(imported_furniture.get('pitch', 0))
-    furniture.roll = float(imported_furniture.get('roll', 0))
-    furniture.widthInPlan = float(imported_furniture.get('widthInPlan', 0))
-    furniture.depthInPlan = float(imported_furniture.get('depthInPlan', 0))
-    furniture.heightInPlan = float(imported_furniture.get('heightInPlan', 0))
+def _get_furniture_rotation(pitch, roll, angle):
+    """Returns the rotation matrix of a piece of furniture.
+
+    The normalized model is facing up, so it is first rotated by pi/2 around
+    the X axis, then by the pitch, the roll and the angle of the furniture.
+
+    Args:
+        pitch (float): the rotation around the X axis, in radians
+        roll (float): the rotation around the Y axis, in radians
+        angle (float): the rotation around the Z axis, in radians
+
+    Returns:
+        ndarray: the 3x3 rotation matrix
+    """
+    # This is the closed form of Rz(-angle) @ Ry(roll) @ Rx(pi/2 - pitch),
+    # knowing that cos(pi/2 - pitch) = sin(pitch) and conversely
+    cx, sx = math.sin(pitch), math.cos(pitch)
+    cy, sy = math.cos(roll), math.sin(roll)
+    cz, sz = math.cos(angle), -math.sin(angle)
+    return numpy.array((
+        (cz*cy, cz*sy*sx - sz*cx, cz*sy*cx + sz*sx),
+        (sz*cy, sz*sy*sx + cz*cx, sz*sy*cx - cz*sx),
+        (-sy,   cy*sx,            cy*cx),
+    ))
+
+# The SweetHome3D attributes imported as properties of the FC objects, as
+# (property_type, name, description, cast, default) tuples. The name of the
+# property is also the name of the imported xml attribute.
+FURNITURE_COMMON_PROPERTIES = (
+    ("App::PropertyString", "id", "The furniture's id", str, None),
+    ("App::PropertyFloat", "angle", "The angle of the furniture", float, 0),
+    ("App::PropertyBool", "visible", "Whether the object is visible", _str2bool, True),
+    ("App::PropertyBool", "movable", "Whether the object is movable", _str2bool, True),
+    ("App::PropertyString", "description", "The object's description", str, ''),
+    ("App::PropertyString", "information", "The object's information", str, ''),
+    ("App::PropertyString", "license", "The object's license", str, ''),
+    ("App::PropertyString", "creator", "The object's creator", str, ''),
+    ("App::PropertyBool", "modelMirrored", "Whether the object is mirrored", _str2bool, False),
+    ("App::PropertyBool", "nameVisible", "Whether the object's name is visible", _str2bool, False),
+    ("App::PropertyFloat", "nameAngle", "The object's name angle", float, 0),
+    ("App::PropertyFloat", "nameXOffset", "The object's name X offset", float, 0),
+    ("App::PropertyFloat", "nameYOffset", "The object's name Y offset", float, 0),
+    ("App::PropertyFloat", "price", "The object's price", float, 0),
+)
+
+PIECE_OF_FURNITURE_COMMON_PROPERTIES = (
+    ("App::PropertyString", "level", "The furniture's level", str, ''),
+    ("App::PropertyString", "catalogId", "The furniture's catalog id", str, ''),
+    ("App::PropertyFloat", "dropOnTopElevation", "", float, 0),
+    ("App::PropertyString", "model", "The object's mesh file", str, ''),
+    ("App::PropertyString", "icon", "The object's icon", str, ''),
+    ("App::PropertyString", "planIcon", "The object's icon for the plan view", str, ''),
+    ("App::PropertyString", "modelRotation", "The object's model rotation", str, ''),
+    ("App::PropertyString", "modelCenteredAtOrigin", "The object's center", str, ''),
+    ("App::PropertyBool", "backFaceShown", "Whether the object's back face is shown", _str2bool, False),
+    ("App::PropertyString", "modelFlags", "The object's flags", str, ''),
+    ("App::PropertyFloat", "modelSize", "The object's size", float, 0),
+    ("App::PropertyBool", "doorOrWindow", "Whether the object is a door or Window", _str2bool, False),
+    ("App::PropertyBool", "resizable", "Whether the object is resizable", _str2bool, True),
+    ("App::PropertyBool", "deformable", "Whether the object is deformable", _str2bool, True),
+    ("App::PropertyBool", "texturable", "Whether the object is texturable", _str2bool, True),
+    ("App::PropertyString", "staircaseCutOutShape", "", str, ''),
+    ("App::PropertyFloat", "shininess", "The object's shininess", float, 0),
+    ("App::PropertyFloat", "valueAddedTaxPercentage", "The object's VAT percentage", float, 0),
+    ("App::PropertyString", "currency", "The object's price currency", str, 'EUR'),
+)
+
+PIECE_OF_FURNITURE_HORIZONTAL_ROTATION_PROPERTIES = (
+    ("App::PropertyBool", "horizontallyRotatable", "Whether the object horizontally rotatable", _str2bool, True),
+    ("App::PropertyFloat", "pitch", "The object's pitch", float, 0),
+    ("App::PropertyFloat", "roll", "The object's roll", float, 0),
+    ("App::PropertyFloat", "widthInPlan", "The object's width in the plan view", float, 0),
+    ("App::PropertyFloat", "depthInPlan", "The object's depth in the plan view", float, 0),
+    ("App::PropertyFloat", "heightInPlan", "The object's height in the plan view", float, 0),
+)
+
+# All the properties of the furnitures and of the doors. NOTE: shType is not
+# an xml attribute, it is set by _import_furniture and _import_door instead.
+FURNITURE_PROPERTIES = FURNITURE_COMMON_PROPERTIES + PIECE_OF_FURNITURE_COMMON_PROPERTIES + PIECE_OF_FURNITURE_HORIZONTAL_ROTATION_PROPERTIES
+DOOR_PROPERTIES = FURNITURE_COMMON_PROPERTIES + PIECE_OF_FURNITURE_COMMON_PROPERTIES + DOOR_OR_WINDOW_PROPERTIES
 
 def _import_materials(imported_furniture):
-    if 'material' not in imported_furniture:
+    # NOTE: `'material' in imported_furniture` compares the children with
+    #   the string and is thus always False
+    furniture_materials = MATERIAL_PATH(imported_furniture)
+    if not furniture_materials:
         return []
 
-    imported_materials = imported_furniture.findall('material')
     materials = []
     try:
-        for imported_material in imported_materials:
+        for imported_material in furniture_materials:
             name = imported_material.get('name')
             color = imported_material.get('color', 'FF000000')
             shininess = imported_material.get('shininess', '0.0')
-            material = Arch.makeMaterial(
-                name=name,
-                color=_hex2rgb(color),
-                transparency=_hex2transparency(color)
-                )
-            _add_property(material, "App::PropertyFloat", "shininess", "The shininess of the material")
-            material.shininess = float(shininess)
+            # The same material is usually shared by several furnitures
+            key = (name, color, shininess)
+            material = imported_materials.get(key)
+            if material is None:
+                material = Arch.makeMaterial(
+                    name=name,
+                    color=_hex2rgb(color),
+                    transparency=_hex2transparency(color)
+                    )
+                _add_property(material, "App::PropertyFloat", "shininess", "The shininess of the material")
+                material.shininess = float(shininess)
+                imported_materials[key] = material
             materials.append(material)
     except Exception as e:
         FreeCAD.Console.PrintError(f"Error while creating material {e}")
 
     return materials
 
-def _import_lights(home, zip, floors):
+def _import_lights(elements, meshes, floor_by_id):
     if not RENDER_AVAILABLE:
         return []
-    list(map(partial(_import_light, zip, floors), enumerate(home.findall('light'))))
-
-def _import_light(zip, floors, imported_tuple):
+    imported_lights = elements['light']
+    light_appliances = []
+    light_sources = []
+    for imported_light in imported_lights:
+        light_appliance, features = _import_light(meshes, floor_by_id, imported_light)
+        light_appliances.append(light_appliance)
+        light_sources.extend(features)
+    FreeCAD.ActiveDocument.Furnitures.addObjects(_get_created_furnitures(imported_lights, light_appliances))
+    FreeCAD.ActiveDocument.Lights.addObjects(light_sources)
+
+LIGHT_SOURCE_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The elment's id"),
+)
+
+def _import_light(meshes, floor_by_id, imported_light):
     """Creates and returns a Render light from the imported_light object
 
     Args:
-        zip (ZipFile): the Zip containing the Mesh file
-        floors (list): the list of imported levels
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        meshes (dict): the decoded Mesh of each model, keyed by model name
+        floor_by_id (dict): the imported levels, see _get_floor_by_id
+        imported_light (Element): the xml element containg the
+            characteristics of the new object
 
     Returns:
-        Mesh: the newly created object
+        tuple: the light's Mesh and the list of the Render lights of its
+            light sources
     """
-    light_appliance = _import_furniture(zip, floors, imported_tuple)
-
-    (i, imported_light) = imported_tuple
+    light_appliance = _import_furniture(meshes, floor_by_id, imported_light)
 
     _add_property(light_appliance, "App::PropertyFloat", "power", "The power of the light")
     light_appliance.power = float(imported_light.get('power', 0.5))
 
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
+    update_gui()
 
-    feature = None
-    for j,light_source in enumerate(imported_light.findall('lightSource')):
+    features = []
+    for j,light_source in enumerate(LIGHT_SOURCE_PATH(imported_light)):
         x = float(light_source.get('x'))
         y = float(light_source.get('y'))
         z = float(light_source.get('z'))
@@ -1153,60 +1522,68 @@ def _import_light(zip, floors, imported_tuple):
 
         light_source_id = f"{imported_light.get('id')}-{j}"
         feature = None
-        if shoul_merge_elements:
+        if should_merge_elements:
             feature = _get_element_to_merge({'id':light_source_id}, 'lightSource')
 
         if not feature:
             _, feature, _ = Render.PointLight.create()
 
         feature.Label = light_appliance.Label
-        feature.Placement.Base = _coord_sh2fc(FreeCAD.Vector(x,y,z))
-        feature.Radius = _dim_sh2fc(diameter / 2)
+        feature.Placement.Base = FreeCAD.Vector(x*FACTOR, -y*FACTOR, z*FACTOR)
+        feature.Radius = diameter / 2 * FACTOR
         feature.Color = _hex2rgb(color)
-        FreeCAD.ActiveDocument.Lights.addObject(feature)
+        features.append(feature)
 
-        _add_property(feature, "App::PropertyString", "shType", "The element type")
-        _add_property(feature, "App::PropertyString", "id", "The elment's id")
+        _add_properties(feature, LIGHT_SOURCE_PROPERTIES)
 
         feature.shType = 'lightSource'
         feature.id = light_source_id
 
-    return feature
+    return light_appliance, features
 
-def _import_cameras(home):
+def _import_cameras(elements):
     if not RENDER_AVAILABLE:
         return []
-    return list(map(partial(_import_camera), enumerate(itertools.chain(home.findall('observerCamera'), home.findall('camera')))))
+    imported_cameras = itertools.chain(elements['observerCamera'], elements['camera'])
+    return [_import_camera(i, imported_camera) for i, imported_camera in enumerate(imported_cameras)]
+
+CAMERA_PROPERTIES = (
+    ("App::PropertyString", "shType", "The element type"),
+    ("App::PropertyString", "id", "The object ID"),
+    ("App::PropertyEnumeration", "attribute", "The type of camera"),
+    ("App::PropertyBool", "fixedSize", "Whether the object is fixed size"),
+)
 
-def _import_camera(imported_tuple):
+def _import_camera(i, imported_camera):
     """Creates and returns a Render Camera from the imported_camera object
 
     Args:
-        imported_tuple (tuple): a tuple containing the index and the
-            dict object containg the characteristics of the new object
+        i (int): the index of the camera in the file
+        imported_camera (Element): the xml element containg the
+            characteristics of the new object
 
     Returns:
         object: the newly created object
     """
-    (i, imported_camera) = imported_tuple
+    attributes = imported_camera.attrib
 
-    x = float(imported_camera.get('x'))
-    y = float(imported_camera.get('y'))
-    z = float(imported_camera.get('z'))
-    yaw = float(imported_camera.get('yaw'))
-    pitch = float(imported_camera.get('pitch'))
+    x = float(attributes.get('x'))
+    y = float(attributes.get('y'))
+    z = float(attributes.get('z'))
+    yaw = float(attributes.get('yaw'))
+    pitch = float(attributes.get('pitch'))
     # ¿How to convert fov to FocalLength?
-    fieldOfView = float(imported_camera.get('fieldOfView'))
+    fieldOfView = float(attributes.get('fieldOfView'))
 
-    attribute = imported_camera.get('attribute')
+    attribute = attributes.get('attribute')
     if attribute != "storedCamera":
         FreeCAD.Console.PrintWarning(f"Camera {i} is of unsupported type '{attribute}'. Skipping!\n")
         return None
     
     camera_id = f"{attribute}-{i}"
     feature = None
-    if shoul_merge_elements:
-        feature = _get_element_to_merge({'id':camera_id}, attribute)
+    if should_merge_elements:
+        feature = _get_element_to_merge({'id':camera_id}, 'camera')
 
     if not feature:
         _, feature, _ = Render.Camera.create()
@@ -1214,84 +1591,127 @@ def _import_camera(imported_tuple):
 
     fieldOfView = math.degrees(fieldOfView)
 
-    feature.Label = imported_camera.get('name', attribute.title())
-    feature.Placement.Base = _coord_sh2fc(FreeCAD.Vector(x,y,z))
+    feature.Label = attributes.get('name', attribute.title())
+    feature.Placement.Base = FreeCAD.Vector(x*FACTOR, -y*FACTOR, z*FACTOR)
     # NOTE: the coordinate system is screen like, thus roll & picth are inverted ZY'X''
     feature.Placement.Rotation.setYawPitchRoll(180-math.degrees(yaw), 0, 90-math.degrees(pitch))
     feature.Projection = "Perspective"
     feature.AspectRatio = 1.33333333 # /home/environment/@photoAspectRatio
 
-    _add_property(feature, "App::PropertyString", "shType", "The element type")
-    _add_property(feature, "App::PropertyEnumeration", "attribute", "The type of camera")
-    _add_property(feature, "App::PropertyBool", "fixedSize", "Whether the object is fixed size")
+    _add_properties(feature, CAMERA_PROPERTIES)
     _add_camera_common_attributes(feature, imported_camera)
 
     feature.shType = 'camera'
     feature.id = camera_id
     feature.attribute = ["topCamera", "observerCamera", "storedCamera", "cameraPath"]
     feature.attribute = attribute
-    feature.fixedSize = bool(imported_camera.get('fixedSize', False))
+    feature.fixedSize = _get_bool(attributes, 'fixedSize', False)
 
-    if i != 0 and i % 5 and FreeCAD.GuiUp:
-        FreeCADGui.updateGui()
+    update_gui()
 
     return feature
 
+CAMERA_COMMON_PROPERTIES = (
+    ("App::PropertyFloat", "yaw", "The object's yaw", float, None),
+    ("App::PropertyFloat", "pitch", "The object's pitch", float, None),
+    ("App::PropertyFloat", "time", "Unknown", float, 0),
+    ("App::PropertyFloat", "fieldOfView", "The object's FOV", float, None),
+    ("App::PropertyString", "renderer", "The object's Unknown", str, ''),
+)
+
 def _add_camera_common_attributes(feature, imported_camera):
-    _add_property(feature, "App::PropertyString", "id", "The object ID")
-    _add_property(feature, "App::PropertyEnumeration", "lens", "The object's lens (PINHOLE | NORMAL | FISHEYE | SPHERICAL)")
-    _add_property(feature, "App::PropertyFloat", "yaw", "The object's yaw")
-    _add_property(feature, "App::PropertyFloat", "pitch", "The object's pitch")
-    _add_property(feature, "App::PropertyFloat", "time", "Unknown")
-    _add_property(feature, "App::PropertyFloat", "fieldOfView", "The object's FOV")
-    _add_property(feature, "App::PropertyString", "renderer", "The object's Unknown")
+    _set_properties(feature, imported_camera, CAMERA_COMMON_PROPERTIES)
 
-    feature.id = str(imported_camera.get('id', True))
+    # The enumeration's values must be set before its value
+    _add_property(feature, "App::PropertyEnumeration", "lens", "The object's lens (PINHOLE | NORMAL | FISHEYE | SPHERICAL)")
     feature.lens = ["PINHOLE", "NORMAL", "FISHEYE", "SPHERICAL"]
-    feature.lens = str(imported_camera.get('lens', "PINHOLE"))
-    feature.yaw = float(imported_camera.get('yaw'))
-    feature.pitch = float(imported_camera.get('pitch'))
-    feature.time = float(imported_camera.get('time', 0))
-    feature.fieldOfView = float(imported_camera.get('fieldOfView'))
-    feature.renderer = str(imported_camera.get('renderer', ''))
+    feature.lens = imported_camera.get('lens', "PINHOLE")
 
 def _rgb2hex(r,g,b):
     return "{:02x}{:02x}{:02x}".format(r,g,b)
 
+@lru_cache(maxsize=None)
 def _hex2rgb(hexcode):
-    # We might have transparency as the first 2 digit
-    offset = 0 if len(hexcode) == 6 else 2
-    return (int(hexcode[offset:offset+2], 16),   # Red
-            int(hexcode[offset+2:offset+4], 16), # Green
-            int(hexcode[offset+4:offset+6], 16)  # Blue
+    # We might have transparency as the first 2 digit. Parse the RGB part
+    # once and extract each channel from the resulting integer. The same
+    # few colors are used over and over, hence the cache.
+    rgb = int(hexcode[-6:], 16)
+    return ((rgb >> 16) & 0xFF, # Red
+            (rgb >> 8) & 0xFF,  # Green
+            rgb & 0xFF          # Blue
             )
 
+@lru_cache(maxsize=None)
 def _hex2transparency(hexcode):
-    return 50 if DEBUG else 100 - int( int(hexcode[0:2], 16) * 100 / 255 )
+    if DEBUG:
+        return 50
+    # Only the AARRGGBB codes carry an alpha channel
+    return 100 - int(hexcode[0:2], 16) * 100 // 255 if len(hexcode) == 8 else 0
 
 def _set_color_and_transparency(obj, color):
-    if not FreeCAD.GuiUp or not color:
+    if not gui_up or not color:
         return
     if hasattr(obj.ViewObject,"ShapeColor"):
         obj.ViewObject.ShapeColor = _hex2rgb(color)
     if hasattr(obj.ViewObject,"Transparency"):
         obj.ViewObject.Transparency = _hex2transparency(color)
 
-def _get_sh3d_property(home, property_name, default_value=None):
-    """Return a SweetHome3D <property> element whith the specified name
+def _get_floats(elements, attributes, default=None):
+    """Returns the given attributes of all the elements as an array of float
+
+    The values are joined and parsed by NumPy in a single call, instead of
+    being converted with float() one at a time.
+
+    Args:
+        elements (list): the xml elements to read the attributes from
+        attributes (tuple): the names of the attributes to read
+        default (str, optional): the value of the missing attributes. Defaults to None.
+
+    Returns:
+        numpy.ndarray: a (len(elements), len(attributes)) array
+    """
+    values = " ".join(element.get(attribute, default) for element in elements for attribute in attributes)
+    return numpy.fromstring(values, dtype=numpy.float64, sep=" ").reshape(-1, len(attributes))
+
+def _get_float(attributes, name, default):
+    """Returns the given attribute as a float
+
+    Args:
+        attributes (dict): the attributes of the xml element
+        name (str): the name of the attribute
+        default (float): the value if the attribute is missing
+
+    Returns:
+        float: the value of the attribute
+    """
+    return float(attributes.get(name, default))
+
+def _get_bool(attributes, name, default):
+    """Returns the given attribute as a bool
+
+    Args:
+        attributes (dict): the attributes of the xml element
+        name (str): the name of the attribute
+        default (bool): the value if the attribute is missing
+
+    Returns:
+        bool: the value of the attribute
+    """
+    return _str2bool(attributes.get(name, default))
+
+def _get_sh3d_properties(elements):
+    """Return the value of the SweetHome3D <property> elements by name
+
+    The <property> elements are walked once, instead of once per looked up
+    property.
 
     Args:
-        home (ElementTree): the root of the SweetHome3D XML file
-        property_name (str): the property name to lookup
-        default_value (any): the property default value
+        elements (dict): The imported elements, see _get_elements_by_tag
 
     Returns:
-        str: the value of said property or None if it does not exists
+        dict: the value of each property, keyed by name
     """
-    for property in home.findall('property'):
-        if property.get('name') == property_name:
-            return property.get('value')
-    return default_value
+    return {property.get('name'): property.get('value') for property in elements['property']}
 
 def _coord_fc2sh(vector):
     """Converts FreeCAD to SweetHome coordinate
@@ -1315,6 +1735,36 @@ def _coord_sh2fc(vector):
     """
     return FreeCAD.Vector(vector.x*FACTOR, -vector.y*FACTOR, vector.z*FACTOR)
 
+def _points_sh2fc(xy, z):
+    """Converts an array of SweetHome points to FreeCAD coordinates
+
+    The conversion is done on the whole array at once and the FreeCAD.Vector
+    are only created at the very end.
+
+    Args:
+        xy (numpy.ndarray): The (N, 2) array of SweetHome x, y coordinates
+        z (float): The SweetHome elevation shared by all the points
+
+    Returns:
+        list: the list of FreeCAD.Vector
+    """
+    z = z * FACTOR
+    return [FreeCAD.Vector(x, y, z) for x, y in _xy_sh2fc(xy).tolist()]
+
+def _xy_sh2fc(xy):
+    """Converts an array of SweetHome x, y coordinates to FreeCAD coordinates
+
+    Args:
+        xy (numpy.ndarray): The array of SweetHome coordinates, its last
+            dimension holding the x, y coordinates
+
+    Returns:
+        numpy.ndarray: the FreeCAD coordinates
+    """
+    fc = xy * FACTOR
+    fc[..., 1] *= -1
+    return fc
+
 def _dim_fc2sh(dimension):
     """Convert FreeCAD dimension (mm) to SweetHome dimension (cm)
 
@@ -1379,23 +1829,64 @@ def _add_property(obj, property_type, name, description):
     if name not in obj.PropertiesList:
         obj.addProperty(property_type, name, "SweetHome3D", description)
 
-def _get_element_to_merge(imported_element, sh_type=None):
+def _add_properties(obj, properties):
+    """Add several properties to the FC object.
+
+    The list of existing properties is fetched only once, and the properties
+    that already exist (i.e. when merging) are skipped. All properties will
+    be added under the 'SweetHome3D' group
+
+    Args:
+        obj (object): The FC object to add the properties to
+        properties (list): a list of (property_type, name, description) tuples
+    """
+    existing = set(obj.PropertiesList)
+    for property_type, name, description in properties:
+        if name not in existing:
+            obj.addProperty(property_type, name, "SweetHome3D", description)
+
+def _set_properties(obj, imported_element, properties):
+    """Add the properties to the FC object and set them from the imported element.
+
+    The list of existing properties is fetched only once. A property is only
+    added when the imported element carries the corresponding attribute, the
+    missing ones being left to their SweetHome3D default. A property that
+    already exists (i.e. when merging) is reset to its default instead. All
+    properties will be added under the 'SweetHome3D' group
+
+    Args:
+        obj (object): The FC object to add the properties to
+        imported_element (et.element): the XML element to read the values from
+        properties (tuple): a tuple of (property_type, name, description,
+            cast, default) tuples, see FURNITURE_COMMON_PROPERTIES
+    """
+    attributes = imported_element.attrib
+    existing = set(obj.PropertiesList)
+    for property_type, name, description, cast, default in properties:
+        if name in attributes:
+            value = attributes[name]
+        elif name in existing:
+            value = default
+        else:
+            continue
+        if name not in existing:
+            obj.addProperty(property_type, name, "SweetHome3D", description)
+        setattr(obj, name, cast(value))
+
+def _get_element_to_merge(imported_element, sh_type):
     """Returns the FC document element corresponding to the imported id and sh_type
 
     Args:
         imported_element (et.element): the XML element to be imported
-        sh_type (str, optional): The SweetHome type of the element to be imported. Defaults to None.
+        sh_type (str): The SweetHome type of the element to be imported
 
     Returns:
         FCObject: The FC object that correspond to the imported SH element
     """
-    global shoul_merge_elements
-    global document_elements
+    # NOTE: document_elements is empty unless the elements should be merged
     id = imported_element.get('id')
-    if shoul_merge_elements and id in document_elements:
-        element = document_elements[id]
-        if sh_type:
-            assert element.shType == sh_type, f"Invalid shType: expected {sh_type}, got {element.shType}"
+    element = document_elements.get((sh_type, id))
+    if element is not None:
         if DEBUG:
             FreeCAD.Console.PrintMessage(f"Merging imported element '{id}' with existing element of type '{type(element)}'\n")
         return element